@@ -1,53 +1,231 @@
 import sys
 import os
+import asyncio
+import io
+import logging
+import random
 import tempfile
+import threading
 import time
-import datetime
-import sounddevice as sd
-import soundfile as sf
-import numpy as np
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel, QMessageBox,
     QHBoxLayout, QProgressBar, QSizePolicy, QSystemTrayIcon, QMenu
 )
 from PySide6.QtGui import QFont, QIcon, QAction, QKeySequence, QShortcut
-from PySide6.QtCore import QTimer, Qt, Signal, Slot
-from PySide6.QtCore import QSharedMemory, QSystemSemaphore  # Ajout pour instance unique
-from PySide6.QtNetwork import QLocalServer, QLocalSocket
+from PySide6.QtCore import QElapsedTimer, QTimer, Qt, Signal, Slot
+from PySide6.QtNetwork import QLocalServer, QLocalSocket  # Instance unique
 
-import openai
-import pyperclip
 import platform
 import webbrowser
 
 ICON_PATH = os.path.join(os.path.dirname(__file__), "mic.ico")  # mets une icône dans ton dossier
 
+# Diagnostics via logging (WARNING par défaut) : jamais de print sur les
+# chemins chauds, et le niveau se règle sans toucher au code
+log = logging.getLogger("voice_transcriptor")
+
+# Symboles user32 résolus une seule fois : chaque ctypes.windll.user32.X
+# refait sinon une recherche dans la table d'exports à chaque activation
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL("user32")
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = (wintypes.HWND, ctypes.c_int)
+    _ShowWindow.restype = wintypes.BOOL
+    _SetForegroundWindow = _user32.SetForegroundWindow
+    _SetForegroundWindow.argtypes = (wintypes.HWND,)
+    _SetForegroundWindow.restype = wintypes.BOOL
+    _RegisterHotKey = _user32.RegisterHotKey
+    _RegisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+    _RegisterHotKey.restype = wintypes.BOOL
+    _UnregisterHotKey = _user32.UnregisterHotKey
+    _UnregisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int)
+    _UnregisterHotKey.restype = wintypes.BOOL
+    _OpenClipboard = _user32.OpenClipboard
+    _OpenClipboard.argtypes = (wintypes.HWND,)
+    _OpenClipboard.restype = wintypes.BOOL
+    _EmptyClipboard = _user32.EmptyClipboard
+    _EmptyClipboard.restype = wintypes.BOOL
+    _SetClipboardData = _user32.SetClipboardData
+    _SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    _SetClipboardData.restype = wintypes.HANDLE
+    _CloseClipboard = _user32.CloseClipboard
+    _CloseClipboard.restype = wintypes.BOOL
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _GlobalAlloc = _kernel32.GlobalAlloc
+    _GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    _GlobalAlloc.restype = wintypes.HGLOBAL
+    _GlobalLock = _kernel32.GlobalLock
+    _GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    _GlobalLock.restype = wintypes.LPVOID
+    _GlobalUnlock = _kernel32.GlobalUnlock
+    _GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    _GlobalUnlock.restype = wintypes.BOOL
+    _GlobalFree = _kernel32.GlobalFree
+    _GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    _GlobalFree.restype = wintypes.HGLOBAL
+    SW_RESTORE = 9
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+    WM_HOTKEY = 0x0312
+    VK_F9 = 0x78
+    HOTKEY_ID = 1
+else:
+    _user32 = None
+
+# Feuille de style unique, parsée une seule fois par Qt : les widgets sont
+# ciblés par objectName et l'état du label de chargement par propriété
+# dynamique, au lieu de re-parser un mini-QSS par widget
+_BASE_STYLE = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QLabel {
+        color: #333;
+    }
+    #filePathLabel {
+        font-size: 10px;
+        color: #666;
+        background-color: #f0f0f0;
+        padding: 4px;
+        border-radius: 3px;
+        margin-top: 10px;
+    }
+    #timeLabel {
+        font-size: 24px;
+        font-weight: bold;
+    }
+    #transcribeBtn, #cancelBtn, #quitBtn {
+        color: white;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    #transcribeBtn {
+        background-color: #4CAF50;
+    }
+    #transcribeBtn:disabled {
+        background-color: #a5d6a7;
+    }
+    #cancelBtn {
+        background-color: #f44336;
+    }
+    #cancelBtn:disabled {
+        background-color: #ef9a9a;
+    }
+    #quitBtn {
+        background-color: #888;
+    }
+    #quitBtn:hover {
+        background-color: #b71c1c;
+    }
+    #loadingLabel {
+        font-size: 14px;
+        color: #555;
+    }
+    #loadingLabel[state="success"] {
+        color: #4CAF50;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    #loadingLabel[state="error"] {
+        color: #f44336;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QProgressBar {
+        border: none;
+        background: #e0e0e0;
+        border-radius: 2px;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 2px;
+    }
+"""
+
+APP_STYLE = _BASE_STYLE + """
+    QLabel, QPushButton {
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+""" if platform.system() == "Windows" else _BASE_STYLE
+
+# Seuil de détection de voix (~-40 dBFS) pour le rognage du silence
+VOICE_THRESHOLD = 0.01
+
+# Durée maximale d'un enregistrement (enregistrement oublié en cours) :
+# borne la mémoire du tee d'upload et la taille du fichier envoyé à
+# l'API. Au-delà, la transcription est finalisée automatiquement plutôt
+# que de jeter le début de la dictée
+MAX_RECORD_SECONDS = 600
+
+# Modèle de transcription, résolu une fois au chargement et substituable
+# sans toucher au code (ex. whisper-1)
+TRANSCRIBE_MODEL = os.getenv("VOICE_TRANSCRIPTOR_MODEL", "gpt-4o-transcribe")
+
 SINGLE_INSTANCE_KEY = "VoiceTranscriptorAppUniqueKey"
-shared_memory = None
 local_server = None  # Ajout
 
-def is_already_running():
-    global shared_memory
-    semaphore = QSystemSemaphore(SINGLE_INSTANCE_KEY + "_sem", 1)
-    semaphore.acquire()
-    # Nettoyage du segment mémoire partagé s'il existe déjà (cas d'un crash)
-    temp_shared = QSharedMemory(SINGLE_INSTANCE_KEY)
-    if temp_shared.attach():
-        temp_shared.detach()
-    shared_memory = QSharedMemory(SINGLE_INSTANCE_KEY)
-    already_running = not shared_memory.create(1)
-    semaphore.release()
-    return already_running
+def _unlink_quiet(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+def _set_clipboard_win(text):
+    # Écriture CF_UNICODETEXT directe : un bloc global UTF-16 remis au
+    # système, qui en devient propriétaire après SetClipboardData
+    if not _OpenClipboard(None):
+        return False
+    try:
+        if not _EmptyClipboard():
+            return False
+        payload = text.encode("utf-16-le") + b"\x00\x00"
+        handle = _GlobalAlloc(GMEM_MOVEABLE, len(payload))
+        if not handle:
+            return False
+        ptr = _GlobalLock(handle)
+        if not ptr:
+            _GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, payload, len(payload))
+        _GlobalUnlock(handle)
+        if not _SetClipboardData(CF_UNICODETEXT, handle):
+            _GlobalFree(handle)
+            return False
+        return True
+    finally:
+        _CloseClipboard()
+
+def _copy_to_clipboard(text):
+    # Sous Windows, on parle directement à l'API presse-papier plutôt que
+    # de passer par la détection de backend de pyperclip ; pyperclip reste
+    # le repli (autres OS, ou presse-papier tenu par une autre application)
+    if _user32 is not None:
+        try:
+            if _set_clipboard_win(text):
+                return
+        except Exception:
+            pass
+    pyperclip.copy(text)
 
 def send_show_request():
+    # Sonde l'instance existante via le socket local : un simple connect
+    # détecte l'instance ET lui demande de se montrer, sans mémoire
+    # partagée ni sémaphore (et sans segment orphelin après un crash).
+    # Renvoie True si une instance tournait déjà.
     socket = QLocalSocket()
     socket.connectToServer(SINGLE_INSTANCE_KEY)
-    if socket.waitForConnected(500):
-        socket.write(b"show")
-        socket.flush()
-        socket.waitForBytesWritten(500)
-        socket.disconnectFromServer()
+    if not socket.waitForConnected(100):
+        return False
+    socket.write(b"show")
+    socket.flush()
+    socket.waitForBytesWritten(100)
+    socket.disconnectFromServer()
+    return True
 
 def start_local_server(main_window):
     global local_server
@@ -60,30 +238,70 @@ def start_local_server(main_window):
     local_server.newConnection.connect(lambda: handle_new_connection(main_window))
 
 def handle_new_connection(main_window):
+    # Lecture pilotée par readyRead : waitForReadyRead(500) bloquait le
+    # thread GUI jusqu'à une demi-seconde si le client tardait à écrire
     socket = local_server.nextPendingConnection()
-    if socket and socket.waitForReadyRead(500):
+    if socket is None:
+        return
+
+    def on_ready():
         data = socket.readAll().data()
         if data == b"show":
             main_window.show_normal_window()
-    socket.disconnectFromServer()
+        socket.disconnectFromServer()
+
+    socket.disconnected.connect(socket.deleteLater)
+    if socket.bytesAvailable():
+        on_ready()
+    else:
+        socket.readyRead.connect(on_ready)
 
 class AudioRecorder(QMainWindow):
     show_success_signal = Signal(str)
     show_error_signal = Signal(str)
+    init_error_signal = Signal(str)
 
     def __init__(self):
         super().__init__()
+
         self.setWindowTitle("Enregistreur Vocal")
         self.setWindowIcon(QIcon(ICON_PATH))
         self.setFixedSize(400, 250)
-        self.setStyleSheet(self.get_platform_stylesheet())
+        self.setStyleSheet(APP_STYLE)
 
-        # Audio config
-        self.sample_rate = 44100
+        self.sample_rate = 16000
         self.channels = 1
         self.recording = False
-        self.audio_frames = []
-        self.start_time = 0
+        # Chrono monotone (QueryPerformanceCounter/CLOCK_MONOTONIC) :
+        # insensible aux sauts d'horloge et moins cher que time.time()
+        self._elapsed = QElapsedTimer()
+        self._last_s = -1
+
+        # Capture sans callback : un thread lecteur boucle sur
+        # stream.read(), qui bloque en C avec le GIL relâché — plus aucun
+        # code Python ne s'exécute sur le thread temps réel de PortAudio
+        self._reader_thread = None
+        self._frames_read = 0
+        # Fichier WAV écrit au fil de l'eau pendant l'enregistrement :
+        # à l'arrêt, le fichier définitif est déjà sur disque
+        self._wav = None
+        # Copie en mémoire, alimentée en parallèle : l'upload part de ces
+        # octets sans relire le fichier depuis le disque
+        self._mem_buf = None
+        self._mem_wav = None
+        self._upload_name = "recording.wav"
+        self._upload_mime = "audio/wav"
+        # Crête absolue observée, tenue à jour par le thread lecteur :
+        # détecte un enregistrement silencieux sans repasser sur le signal.
+        # Les bornes voisées (premier/dernier bloc au-dessus du seuil)
+        # permettent de rogner le silence avant l'upload — les secondes
+        # facturées par l'API sont proportionnelles à la durée envoyée
+        self._peak = 0.0
+        self._first_voiced = None
+        self._last_voiced = 0
+        # Débordements signalés par stream.read, comptés et rapportés à
+        # l'arrêt seulement
+        self._xruns = 0
 
         # Dossier de sauvegarde des enregistrements
         self.setup_recordings_dir()
@@ -96,82 +314,117 @@ class AudioRecorder(QMainWindow):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_timer)
 
-        # OpenAI config
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        if not openai.api_key:
-            QMessageBox.critical(
-                self,
-                "Erreur",
-                "La clé API OpenAI n'a pas été trouvée. Veuillez définir la variable d'environnement OPENAI_API_KEY."
-            )
-            sys.exit(1)
-
-
-
         self.show_success_signal.connect(self.show_success)
         self.show_error_signal.connect(self.show_error)
-
-        # Raccourci clavier interne (F9)
-        shortcut = QShortcut(QKeySequence("F9"), self)
-        shortcut.activated.connect(self.toggle_recording)
+        self.init_error_signal.connect(self._show_init_error)
+
+        # Les imports lourds (numpy, sounddevice, soundfile, openai) et le
+        # sondage du périphérique partent sur un thread de fond : la
+        # fenêtre s'affiche tout de suite au lieu d'attendre ~1-2 s de
+        # chargement de modules. toggle_recording attend l'événement si
+        # l'utilisateur est plus rapide que le chargement
+        self._stack_ready = threading.Event()
+        self._stack_ok = False
+        threading.Thread(target=self._load_audio_stack, daemon=True).start()
+
+        # Raccourci F9 : global via RegisterHotKey sous Windows (Windows ne
+        # délivre WM_HOTKEY que sur F9, coût nul au repos, pas de hook
+        # clavier système) ; sinon raccourci Qt limité à la fenêtre
+        if not self.setup_global_hotkey():
+            shortcut = QShortcut(QKeySequence("F9"), self)
+            shortcut.activated.connect(self.toggle_recording)
 
         self.force_quit = False
 
 
+    def _load_audio_stack(self):
+        # Tourne hors du thread GUI : uniquement des imports, du ctypes et
+        # des objets asyncio — aucun widget n'est touché ici. Tout échec
+        # (DLL PortAudio introuvable, clé absente…) est remonté au thread
+        # GUI via init_error_signal, et _stack_ready est signalé dans tous
+        # les cas pour que toggle_recording n'attende jamais dans le vide
+        global np, sd, sf, openai, pyperclip
+        try:
+            import numpy as np
+            import sounddevice as sd
+            import soundfile as sf
+            import openai
+            import pyperclip
+
+            # Audio config : 16 kHz mono, la fréquence interne de Whisper —
+            # capturer à 44,1 kHz uploade 2,75× plus d'octets pour la même
+            # transcription. Repli sur 44,1 kHz si le périphérique refuse.
+            # int16 dès la capture : même précision utile pour la voix,
+            # moitié moins d'octets à copier et à encoder que le float32
+            # par défaut
+            try:
+                sd.check_input_settings(
+                    samplerate=self.sample_rate, channels=self.channels, dtype='int16'
+                )
+            except Exception:
+                self.sample_rate = 44100
+
+            # OpenAI config
+            openai.api_key = os.getenv("OPENAI_API_KEY")
+            if not openai.api_key:
+                self.init_error_signal.emit(
+                    "La clé API OpenAI n'a pas été trouvée. Veuillez définir la variable d'environnement OPENAI_API_KEY."
+                )
+                return
+
+            # Client asynchrone + boucle asyncio de fond : pas de création de
+            # thread OS à chaque transcription, et plusieurs requêtes peuvent
+            # être en vol si les enregistrements s'enchaînent
+            self._aclient = openai.AsyncOpenAI()
+            # Garde-fou : au plus 5 uploads simultanés si l'utilisateur
+            # enchaîne les enregistrements, pour ne pas saturer l'uplink
+            # ni déclencher de 429 en rafale
+            self._sem = asyncio.Semaphore(5)
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            asyncio.run_coroutine_threadsafe(self._warmup(), self._loop)
+            self._stack_ok = True
+        except Exception as e:
+            self.init_error_signal.emit(
+                f"Échec de l'initialisation audio : {e}"
+            )
+        finally:
+            self._stack_ready.set()
 
+    @Slot(str)
+    def _show_init_error(self, message):
+        QMessageBox.critical(self, "Erreur", message)
+        QApplication.quit()
 
     @Slot()
     def show_normal_window(self):
         self.showNormal()
         self.raise_()
         self.activateWindow()
-        if platform.system() == "Windows":
-            import ctypes
+        if _user32 is not None:
             hwnd = int(self.winId())
-            SW_RESTORE = 9
-            ctypes.windll.user32.ShowWindow(hwnd, SW_RESTORE)
-            ctypes.windll.user32.SetForegroundWindow(hwnd)
+            _ShowWindow(hwnd, SW_RESTORE)
+            _SetForegroundWindow(hwnd)
 
 
     @Slot()
     def quit_app(self):
         self.close()
 
+    def setup_global_hotkey(self):
+        if _user32 is None:
+            return False
+        return bool(_RegisterHotKey(int(self.winId()), HOTKEY_ID, 0, VK_F9))
+
+    def nativeEvent(self, eventType, message):
+        if _user32 is not None and eventType == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                self.toggle_recording()
+                return True, 0
+        return super().nativeEvent(eventType, message)
 
 
-    def get_platform_stylesheet(self):
-        base_style = """
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QLabel {
-                color: #333;
-            }
-            #filePathLabel {
-                font-size: 10px;
-                color: #666;
-                background-color: #f0f0f0;
-                padding: 4px;
-                border-radius: 3px;
-                margin-top: 10px;
-            }
-        """
-        if platform.system() == "Windows":
-            return base_style + """
-                QLabel, QPushButton {
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                }
-                QProgressBar {
-                    border: none;
-                    background: #e0e0e0;
-                    border-radius: 2px;
-                }
-                QProgressBar::chunk {
-                    background-color: #4CAF50;
-                    border-radius: 2px;
-                }
-            """
-        return base_style
 
     def setup_recordings_dir(self):
         if platform.system() == "Windows":
@@ -193,8 +446,8 @@ class AudioRecorder(QMainWindow):
         layout = QVBoxLayout(self.content_widget)
 
         self.time_label = QLabel("00:00")
+        self.time_label.setObjectName("timeLabel")
         self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet("font-size: 24px; font-weight: bold;")
 
         self.button_container = QWidget()
         button_layout = QHBoxLayout(self.button_container)
@@ -202,35 +455,11 @@ class AudioRecorder(QMainWindow):
         button_layout.setSpacing(10)
 
         self.transcribe_btn = QPushButton("Démarrer la transcription")
-        self.transcribe_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:disabled {
-                background-color: #a5d6a7;
-            }
-        """)
+        self.transcribe_btn.setObjectName("transcribeBtn")
         self.transcribe_btn.clicked.connect(self.toggle_recording)
 
         self.cancel_btn = QPushButton("Annuler")
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:disabled {
-                background-color: #ef9a9a;
-            }
-        """)
+        self.cancel_btn.setObjectName("cancelBtn")
         self.cancel_btn.clicked.connect(self.cancel_recording)
 
         button_layout.addWidget(self.transcribe_btn)
@@ -251,19 +480,7 @@ class AudioRecorder(QMainWindow):
         layout.addWidget(self.file_path_label, alignment=Qt.AlignCenter)
 
         self.quit_btn = QPushButton("Quitter l'application")
-        self.quit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #888;
-                color: white;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-        """)
+        self.quit_btn.setObjectName("quitBtn")
         self.quit_btn.clicked.connect(self.quit_app)
         layout.addWidget(self.quit_btn, alignment=Qt.AlignCenter)
 
@@ -273,24 +490,13 @@ class AudioRecorder(QMainWindow):
         loading_layout.setSpacing(15)
 
         self.loading_label = QLabel()
+        self.loading_label.setObjectName("loadingLabel")
         self.loading_label.setAlignment(Qt.AlignCenter)
-        self.loading_label.setStyleSheet("font-size: 14px; color: #555;")
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background: #e0e0e0;
-                border-radius: 2px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-        """)
 
         loading_layout.addWidget(self.loading_label, alignment=Qt.AlignCenter)
         loading_layout.addWidget(self.progress_bar)
@@ -302,6 +508,17 @@ class AudioRecorder(QMainWindow):
 
     @Slot()
     def toggle_recording(self):
+        if not self._stack_ready.is_set():
+            # Démarrage avant la fin du chargement de fond : on attend la
+            # fin des imports (quelques centaines de ms au pire)
+            self._stack_ready.wait(timeout=10)
+        if not self._stack_ok:
+            # Chargement échoué (l'erreur détaillée est déjà affichée par
+            # _show_init_error) ou toujours en cours après 10 s : message
+            # visible plutôt qu'un silence
+            self.show_loading("")
+            self.show_error("Initialisation audio incomplète — enregistrement impossible.")
+            return
         if not self.recording:
             self.start_transcription_workflow()
         else:
@@ -319,44 +536,130 @@ class AudioRecorder(QMainWindow):
 
     def start_recording(self):
         self.recording = True
-        self.audio_frames = []
-        self.start_time = time.time()
-        self.timer.start(100)
+        self._frames_read = 0
+        self._peak = 0.0
+        self._first_voiced = None
+        self._last_voiced = 0
+        self._xruns = 0
+        self._elapsed.start()
+        self._last_s = -1
+        # 500 ms suffisent pour un affichage à la seconde : 10 Hz faisait
+        # 9 réveils inutiles sur 10
+        self.timer.start(500)
         self.update_timer()
 
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        # time.strftime formate en C, sans construire d'objet datetime sur
+        # le chemin du démarrage d'enregistrement
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         self.current_recording_path = self.recordings_dir / f"recording_{timestamp}.wav"
-        self.file_path_label.setText(f"Enregistrement en cours : {self.current_recording_path}")
+        try:
+            self._wav = sf.SoundFile(
+                str(self.current_recording_path), mode='w',
+                samplerate=self.sample_rate, channels=self.channels, subtype='PCM_16'
+            )
+        except Exception:
+            # Dossier inaccessible : on se rabat sur le répertoire temporaire
+            self.current_recording_path = Path(tempfile.gettempdir()) / f"recording_{timestamp}.wav"
+            self._wav = sf.SoundFile(
+                str(self.current_recording_path), mode='w',
+                samplerate=self.sample_rate, channels=self.channels, subtype='PCM_16'
+            )
+            self.file_path_label.setText(
+                f"Erreur de sauvegarde, vérifiez les permissions :\n{self.recordings_dir}"
+            )
+        else:
+            self.file_path_label.setText(f"Enregistrement en cours : {self.current_recording_path}")
+
+        self._mem_buf = io.BytesIO()
+        # Opus à 16 kHz : ~1/30e des octets d'un WAV PCM_16 pour la même
+        # transcription — l'upload domine la latence de bout en bout.
+        # L'archive disque reste un WAV lisible partout, et Opus n'accepte
+        # que 8/12/16/24/48 kHz : WAV en repli (cas 44,1 kHz)
+        if self.sample_rate in (8000, 12000, 16000, 24000, 48000):
+            self._upload_name = "recording.ogg"
+            self._upload_mime = "audio/ogg"
+            self._mem_wav = sf.SoundFile(
+                self._mem_buf, mode='w', samplerate=self.sample_rate,
+                channels=self.channels, format='OGG', subtype='OPUS'
+            )
+        else:
+            self._upload_name = "recording.wav"
+            self._upload_mime = "audio/wav"
+            self._mem_wav = sf.SoundFile(
+                self._mem_buf, mode='w', samplerate=self.sample_rate,
+                channels=self.channels, subtype='PCM_16', format='WAV'
+            )
 
-        self.stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            callback=self.audio_callback
-        )
+        # Blocs de 100 ms et latence « haute » : on ne fait que capturer,
+        # la latence d'entrée est sans effet perceptible ; repli sur la
+        # latence par défaut si le pilote refuse
+        blocksize = self.sample_rate // 10
+        try:
+            self.stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                blocksize=blocksize,
+                channels=self.channels,
+                dtype='int16',
+                latency='high'
+            )
+        except sd.PortAudioError:
+            self.stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                blocksize=blocksize,
+                channels=self.channels,
+                dtype='int16'
+            )
         self.stream.start()
-
-    def audio_callback(self, indata, frames, time, status):
-        if self.recording:
-            self.audio_frames.append(indata.copy())
+        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader_thread.start()
+
+    def _reader_loop(self):
+        blocksize = self.sample_rate // 10
+        while self.recording:
+            data, overflowed = self.stream.read(blocksize)
+            if overflowed:
+                self._xruns += 1
+            self._wav.write(data)
+            self._mem_wav.write(data)
+            # Crête normalisée sur [0,1] pour garder les seuils en dBFS
+            block_peak = float(np.abs(data).max()) / 32768.0
+            if block_peak > self._peak:
+                self._peak = block_peak
+            if block_peak >= VOICE_THRESHOLD:
+                if self._first_voiced is None:
+                    self._first_voiced = self._frames_read
+                self._last_voiced = self._frames_read + len(data)
+            self._frames_read += len(data)
 
     def update_timer(self):
-        if self.recording:
-            elapsed = int(time.time() - self.start_time)
-            minutes = elapsed // 60
-            seconds = elapsed % 60
-            self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+        if not self.recording:
+            return
+        s = self._elapsed.elapsed() // 1000
+        if s >= MAX_RECORD_SECONDS:
+            self.finish_recording()
+            return
+        if s != self._last_s:
+            self._last_s = s
+            self.time_label.setText(f"{s // 60:02d}:{s % 60:02d}")
+
+    def _set_loading_state(self, state):
+        # Changement d'état via propriété dynamique : Qt re-matche la QSS
+        # déjà parsée au lieu d'en analyser une nouvelle
+        self.loading_label.setProperty("state", state)
+        self.loading_label.style().unpolish(self.loading_label)
+        self.loading_label.style().polish(self.loading_label)
 
     def show_loading(self, message):
         self.content_widget.hide()
         self.loading_label.setText(message)
-        self.loading_label.setStyleSheet("font-size: 14px; color: #555;")
+        self._set_loading_state("")
         self.progress_bar.show()
         self.loading_widget.show()
 
     @Slot(str)
     def show_success(self, message, close_delay=1500):
         self.loading_label.setText(message)
-        self.loading_label.setStyleSheet("color: #4CAF50; font-size: 16px; font-weight: bold;")
+        self._set_loading_state("success")
         self.progress_bar.hide()
         QTimer.singleShot(close_delay, self.reset_ui_for_next_transcription)
 
@@ -376,78 +679,172 @@ class AudioRecorder(QMainWindow):
         self.stop_recording()
         self.transcribe_btn.setEnabled(False)
         self.cancel_btn.setEnabled(False)
+
+        # Double appui accidentel ou micro muet : on épargne l'upload,
+        # la latence et la facturation d'un appel API inutile
+        duration = self._frames_read / self.sample_rate
+        if duration < 0.3 or self._peak < 10 ** (-50 / 20):  # −50 dBFS
+            self._mem_buf = None
+            self.show_loading("")
+            self.show_error("Enregistrement vide ou silencieux — transcription ignorée.")
+            return
+
         self.show_loading("Transcription en cours...")
 
-        def process_audio():
-            tmp_file = None
+        audio_bytes = self._mem_buf.getvalue()
+        self._mem_buf = None
+
+        # Bornes de rognage : 0,2 s de marge autour de la voix détectée ;
+        # on ne rogne que si le gain dépasse une demi-seconde facturée.
+        # Aucun bloc au-dessus du seuil de détection (voix très faible mais
+        # au-dessus du garde-fou −50 dBFS) : pas de bornes fiables, on
+        # envoie l'enregistrement entier plutôt que de le tronquer
+        trim = None
+        if self._first_voiced is not None:
+            margin = int(0.2 * self.sample_rate)
+            total = self._frames_read
+            trim_start = max(0, self._first_voiced - margin)
+            trim_end = min(total, self._last_voiced + margin)
+            if trim_start + (total - trim_end) > self.sample_rate // 2:
+                trim = (trim_start, trim_end)
+
+        asyncio.run_coroutine_threadsafe(
+            self._transcribe(audio_bytes, self._upload_name, self._upload_mime,
+                             self.current_recording_path, trim),
+            self._loop
+        )
+
+    async def _warmup(self):
+        # Pré-établit la connexion TLS et le pool httpx pendant que
+        # l'application est inactive : la première vraie transcription
+        # économise ~300-600 ms de handshake. Une simple lecture de
+        # métadonnées suffit — pas d'audio facturé
+        try:
+            await self._aclient.models.retrieve(TRANSCRIBE_MODEL)
+        except Exception:
+            pass
+
+    async def _create_transcription_with_backoff(self, filename, audio_bytes, mime,
+                                                 max_retries=5, base=1.0, cap=30.0):
+        # Les 429 et 5xx sont transitoires : on réessaie avec délai
+        # exponentiel + gigue plutôt que de remonter l'erreur à l'utilisateur
+        for attempt in range(max_retries + 1):
             try:
-                tmp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                audio_data = np.concatenate(self.audio_frames, axis=0)
-                sf.write(tmp_file.name, audio_data, self.sample_rate)
-                if self.current_recording_path:
-                    try:
-                        sf.write(str(self.current_recording_path), audio_data, self.sample_rate)
-                        self.file_path_label.setText(f"Enregistrement sauvegardé :\n{self.current_recording_path}")
-                    except Exception:
-                        self.file_path_label.setText(f"Erreur de sauvegarde, vérifiez les permissions :\n{self.recordings_dir}")
-                with open(tmp_file.name, "rb") as audio_file:
-                    response = openai.audio.transcriptions.create(
-                        model="gpt-4o-transcribe",
-                        file=audio_file
-                    )
-                transcription = response.text
-                pyperclip.copy(transcription)
-                success_msg = "Transcription terminée !"
-                if self.current_recording_path:
-                    success_msg += f"\nL'audio est sauvegardé ici :\n{self.current_recording_path}"
-                self.show_success_signal.emit(success_msg)
-            except Exception as e:
-                error_msg = f"Erreur lors de la transcription : {str(e)}"
-                if self.current_recording_path:
-                    error_msg += f"\n\nL'enregistrement audio a été sauvegardé ici :\n{self.current_recording_path}"
-                self.show_error_signal.emit(error_msg)
-            finally:
-                if tmp_file and os.path.exists(tmp_file.name):
-                    for attempt in range(10):
-                        try:
-                            os.unlink(tmp_file.name)
-                            break
-                        except Exception:
-                            time.sleep(0.2)
-        import threading
-        self.worker_thread = threading.Thread(target=process_audio, daemon=True)
-        self.worker_thread.start()
+                return await self._aclient.audio.transcriptions.create(
+                    model=TRANSCRIBE_MODEL,
+                    file=(filename, audio_bytes, mime)
+                )
+            except (openai.RateLimitError, openai.APIStatusError) as e:
+                transient = (
+                    isinstance(e, openai.RateLimitError)
+                    or 500 <= getattr(e, "status_code", 0) < 600
+                )
+                if not transient or attempt == max_retries:
+                    raise
+                await asyncio.sleep(min(cap, base * 2 ** attempt) + random.random() * base)
+
+    def _trim_encoded(self, audio_bytes, start, end, upload_name):
+        # Ré-encode la tranche voisée uniquement ; décodage + encodage
+        # restent négligeables devant l'upload économisé
+        data, sr = sf.read(io.BytesIO(audio_bytes), dtype='float32', always_2d=True)
+        start = min(start, len(data))
+        end = min(end, len(data))
+        buf = io.BytesIO()
+        if upload_name.endswith(".ogg"):
+            sf.write(buf, data[start:end], sr, format='OGG', subtype='OPUS')
+        else:
+            sf.write(buf, data[start:end], sr, format='WAV', subtype='PCM_16')
+        return buf.getvalue()
+
+    async def _transcribe(self, audio_bytes, upload_name, upload_mime,
+                          recording_path, trim=None):
+        try:
+            if trim is not None:
+                audio_bytes = await asyncio.to_thread(
+                    self._trim_encoded, audio_bytes, trim[0], trim[1], upload_name
+                )
+            async with self._sem:
+                response = await self._create_transcription_with_backoff(
+                    upload_name, audio_bytes, upload_mime
+                )
+            transcription = response.text
+            _copy_to_clipboard(transcription)
+            success_msg = "Transcription terminée !"
+            if recording_path:
+                success_msg += f"\nL'audio est sauvegardé ici :\n{recording_path}"
+            self.show_success_signal.emit(success_msg)
+        except Exception as e:
+            error_msg = f"Erreur lors de la transcription : {str(e)}"
+            if recording_path:
+                error_msg += f"\n\nL'enregistrement audio a été sauvegardé ici :\n{recording_path}"
+            self.show_error_signal.emit(error_msg)
 
     @Slot(str)
     def show_error(self, error_message):
         self.loading_label.setText(error_message)
-        self.loading_label.setStyleSheet("color: #f44336; font-size: 16px; font-weight: bold;")
+        self._set_loading_state("error")
         self.progress_bar.hide()
         QTimer.singleShot(2000, self.reset_ui_for_next_transcription)
 
     def cancel_recording(self):
         if self.recording:
             self.stop_recording()
+            # Annulation : on ne conserve pas le fichier partiel. Un seul
+            # unlink ; si Windows retient encore le handle, une unique
+            # reprise différée plutôt qu'une boucle d'attente bloquante
+            if self.current_recording_path:
+                path = str(self.current_recording_path)
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    QTimer.singleShot(500, lambda: _unlink_quiet(path))
+                self.current_recording_path = None
+            self._mem_buf = None
         self.reset_ui_for_next_transcription()  # Réinitialise l'UI
         self.showMinimized()  # Minimise la fenêtre
 
     def stop_recording(self):
+        # Le lecteur sort de sa boucle dès que le read en cours (≤100 ms)
+        # rend la main ; on ne ferme le flux qu'après
+        self.recording = False
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout=2)
+            self._reader_thread = None
         if hasattr(self, 'stream') and self.stream.active:
-            self.stream.stop()
+            # abort() rend la main sans drainer : les trames encore en file
+            # sont postérieures à l'arrêt et ne seraient pas lues de toute
+            # façon, le lecteur ayant déjà quitté sa boucle
+            self.stream.abort()
             self.stream.close()
-        self.recording = False
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+        if self._mem_wav is not None:
+            # SoundFile ne ferme pas le BytesIO sous-jacent : l'en-tête WAV
+            # est finalisé, les octets restent disponibles pour l'upload
+            self._mem_wav.close()
+            self._mem_wav = None
+        if self._xruns:
+            log.warning(
+                "%d avertissement(s) PortAudio (xrun) pendant l'enregistrement",
+                self._xruns
+            )
         self.timer.stop()
 
 
 
     def closeEvent(self, event):
+        if _user32 is not None:
+            _UnregisterHotKey(int(self.winId()), HOTKEY_ID)
         event.accept()
 
 
 def main():
+    logging.basicConfig(level=logging.WARNING)
     app = QApplication(sys.argv)
-    if is_already_running():
-        send_show_request()
+    if send_show_request():
         return
     recorder = AudioRecorder()
     start_local_server(recorder)